@@ -113,28 +113,30 @@ class Collection:
             >>> collection.bibliography
             ''
 
+        TESTS:
+
+        The returned database can be modified without affecting the entries::
+
+            >>> collection = Collection.create_example()
+            >>> bibliography = collection.bibliography
+            >>> bibliography.entries['alves_2011_electrochemistry_6010'].fields['title'] = 'Another Title'
+            >>> collection.bibliography.entries['alves_2011_electrochemistry_6010'].fields['title']
+            'Electrochemistry at Ru(0001) in a flowing CO-saturated electrolyte—reactive and inert adlayer phases'
+
         """
         from pybtex.database import BibliographyData
 
-        bib_data = BibliographyData(
-            {
-                entry.bibliography.key: entry.bibliography
-                for entry in self
-                if entry.bibliography
-            }
-        )
-
-        if isinstance(bib_data, str):
-            return bib_data
+        bib_data = BibliographyData()
 
-        # Remove duplicates from the bibliography
-        bib_data_ = BibliographyData()
+        for entry in self:
+            bibliography = entry.bibliography
 
-        for key, entry in bib_data.entries.items():
-            if key not in bib_data_.entries:
-                bib_data_.add_entry(key, entry)
+            # Entries from the same publication have the same bibliography
+            # which is added only once.
+            if bibliography and bibliography.key not in bib_data.entries:
+                bib_data.add_entry(bibliography.key, bibliography)
 
-        return bib_data_
+        return bib_data
 
     def filter(self, predicate):
         r"""
@@ -160,7 +162,7 @@ class Collection:
             try:
                 return predicate(entry)
             except (KeyError, AttributeError) as e:
-                logger.debug(f"Filter removed entry {entry} due to error: {e}")
+                logger.debug("Filter removed entry %s due to error: %s", entry, e)
                 return False
 
         return type(self)(
@@ -81,10 +81,38 @@ class CVCollection(Collection):
             True
 
         """
-        import pandas as pd
+        return {entry.get_electrode("WE").material for entry in self}
 
-        return set(
-            pd.unique(pd.Series([entry.get_electrode("WE").material for entry in self]))
+    def thumbnails(self, width=96, height=72, dpi=72, **kwds):
+        r"""
+        Return thumbnails of the curves of the entries as PNG byte streams
+        indexed by the entries' identifiers.
+
+        The arguments are the same as for
+        :meth:`unitpackage.cv.cv_entry.CVEntry.thumbnail`. The thumbnails are
+        rendered with :meth:`unitpackage.cv.cv_entry.CVEntry.thumbnail_batch`,
+        which is much faster than calling ``thumbnail`` on each entry.
+
+        EXAMPLES::
+
+            >>> collection = CVCollection.create_example()
+            >>> thumbnails = collection.thumbnails()
+            >>> len(thumbnails)
+            3
+            >>> entry = collection['alves_2011_electrochemistry_6010_f1a_solid']
+            >>> thumbnails[entry.identifier] == entry.thumbnail()
+            True
+
+        """
+        entries = list(self)
+
+        return dict(
+            zip(
+                (entry.identifier for entry in entries),
+                self.Entry.thumbnail_batch(
+                    entries, width=width, height=height, dpi=dpi, **kwds
+                ),
+            )
         )
 
     def describe(self):
@@ -101,11 +129,11 @@ class CVCollection(Collection):
             True
 
         """
+        bibliography = self.bibliography
+
         return {
             "number of references": (
-                0
-                if isinstance(self.bibliography, str)
-                else len(self.bibliography.entries)
+                0 if isinstance(bibliography, str) else len(bibliography.entries)
             ),
             "number of entries": len(self),
             "materials": self.materials(),
@@ -44,6 +44,7 @@ where ``I`` or. ``j`` is plotted vs. ``U`` or. ``E``::
 #  You should have received a copy of the GNU General Public License
 #  along with unitpackage. If not, see <https://www.gnu.org/licenses/>.
 # ********************************************************************
+import io
 import logging
 
 from unitpackage.entry import Entry
@@ -137,9 +138,10 @@ class CVEntry(Entry):
 
         return super().rescale(units)
 
-    def _normalize_field_name(self, field_name):
+    def normalize_field_name(self, field_name):
         r"""
-        Return the name of a field name of the `unitpackage` resource.
+        Return the name of the field of the ``echemdb`` resource which
+        corresponds to ``field_name``.
 
         If 'j' is requested but is not present in the resource,
         'I' is returned instead.
@@ -147,18 +149,28 @@ class CVEntry(Entry):
         EXAMPLES::
 
             >>> entry = CVEntry.create_examples()[0]
-            >>> entry._normalize_field_name('j')
+            >>> entry.normalize_field_name('j')
             'j'
-            >>> entry._normalize_field_name('x')
+            >>> entry.normalize_field_name('x')
             Traceback (most recent call last):
             ...
             ValueError: No axis with name 'x' found.
 
+        TESTS:
+
+        When the resource contains no ``j``, the current ``I`` is used instead::
+
+            >>> entry = CVEntry.from_csv(csvname='examples/from_csv/from_csv.csv')
+            >>> entry.normalize_field_name('j')
+            'I'
+
         """
-        if field_name in self.package.get_resource("echemdb").schema.field_names:
+        field_names = self.package.get_resource("echemdb").schema.field_names
+
+        if field_name in field_names:
             return field_name
-        if field_name == "j":
-            return self._normalize_field_name("I")
+        if field_name == "j" and "I" in field_names:
+            return "I"
         raise ValueError(f"No axis with name '{field_name}' found.")
 
     def thumbnail(self, width=96, height=72, dpi=72, **kwds):
@@ -172,40 +184,71 @@ class CVEntry(Entry):
             b'\x89PNG...'
 
         The PNG's ``width`` and ``height`` can be specified in pixels.
-        Additional keyword arguments are passed to the data frame plotting
-        method::
+        Additional keyword arguments are passed to matplotlib's
+        :meth:`~matplotlib.axes.Axes.plot`, i.e., they are properties of the drawn line::
 
             >>> entry.thumbnail(width=4, height=2, color='red', linewidth=2)
             b"\x89PNG..."
 
+        """
+        return next(
+            self.thumbnail_batch([self], width=width, height=height, dpi=dpi, **kwds)
+        )
+
+    @classmethod
+    def thumbnail_batch(cls, entries, width=96, height=72, dpi=72, **kwds):
+        r"""
+        Return an iterator over thumbnails of the curves of ``entries`` as
+        PNG byte streams.
+
+        The arguments are the same as for :meth:`thumbnail`. All thumbnails
+        are drawn into the same figure, which is considerably faster than
+        calling :meth:`thumbnail` for each entry.
+
+        EXAMPLES::
+
+            >>> entries = CVEntry.create_examples()
+            >>> thumbnails = CVEntry.thumbnail_batch(entries, color='red')
+            >>> next(thumbnails) == entries[0].thumbnail(color='red')
+            True
+
         """
         kwds.setdefault("color", "b")
         kwds.setdefault("linewidth", 1)
-        kwds.setdefault("legend", False)
 
-        import matplotlib.pyplot
+        # We render with the Agg canvas directly instead of pyplot, since
+        # pyplot keeps track of all figures in a global state.
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
 
         # A reasonable DPI setting that should work for most screens is the default value of 72.
-        fig, axis = matplotlib.pyplot.subplots(
-            1, 1, figsize=[width / dpi, height / dpi], dpi=dpi
-        )
-        self.df.plot(
-            "E",
-            self._normalize_field_name("j"),
-            ax=axis,
-            **kwds,
-        )
-
-        matplotlib.pyplot.axis("off")
-        matplotlib.pyplot.close(fig)
+        fig = Figure(figsize=[width / dpi, height / dpi], dpi=dpi)
+        canvas = FigureCanvasAgg(fig)
+        axis = fig.add_subplot(1, 1, 1)
+        axis.set_axis_off()
+
+        # Make the background transparent once, as savefig(transparent=True)
+        # would do (and undo) for each thumbnail.
+        fig.patch.set(facecolor="none", edgecolor="none")
+        axis.patch.set(facecolor="none", edgecolor="none")
+
+        (line,) = axis.plot([], [], **kwds)
+
+        for entry in entries:
+            df = entry.df
+            line.set_data(
+                df["E"].to_numpy(),
+                df[entry.normalize_field_name("j")].to_numpy(),
+            )
 
-        import io
+            # Rescale the axes to the new data.
+            axis.relim()
+            axis.autoscale_view()
 
-        buffer = io.BytesIO()
-        fig.savefig(buffer, format="png", transparent=True, dpi=dpi)
+            buffer = io.BytesIO()
+            canvas.print_png(buffer)
 
-        buffer.seek(0)
-        return buffer.read()
+            yield buffer.getvalue()
 
     def plot(self, x_label="E", y_label="j", name=None):
         r"""
@@ -231,37 +274,33 @@ class CVEntry(Entry):
             Figure(...)
 
         """
-        x_label = self._normalize_field_name(x_label)
-        y_label = self._normalize_field_name(y_label)
-
-        def figure_name():
-            if (
-                hasattr(self.package, "source")
-                and hasattr(self.package.source, "figure")
-                and hasattr(self.package.source, "curve")
-            ):
-                return f"Fig. {self.source.figure}: {self.source.curve}"
-
-            return self.identifier
-
-        fig = super().plot(x_label=x_label, y_label=y_label, name=name or figure_name())
-
-        def reference(label):
-            if not label == "E":
-                return ""
-            field = (
-                self.package.get_resource("echemdb").schema.get_field(label).to_dict()
-            )
-            if "reference" not in field:
-                return ""
-            return f" vs. {field['reference']}"
+        x_label = self.normalize_field_name(x_label)
+        y_label = self.normalize_field_name(y_label)
+
+        return super().plot(x_label=x_label, y_label=y_label, name=name)
+
+    def _axis_label(self, field_name):
+        r"""
+        Return the axis label of the field ``field_name`` used in :meth:`plot`.
 
-        def axis_label(label):
-            return f"{label} [{self.field_unit(label)}{reference(label)}]"
+        In addition to the unit, the label of the potential ``E``
+        contains the reference electrode, if it is provided.
 
-        fig.update_layout(
-            xaxis_title=axis_label(x_label),
-            yaxis_title=axis_label(y_label),
+        EXAMPLES::
+
+            >>> entry = CVEntry.create_examples()[0]
+            >>> entry._axis_label('E')
+            'E [V vs. RHE]'
+            >>> entry._axis_label('j')
+            'j [A / m2]'
+
+        """
+        # The unit and the reference are both read from the field's custom properties.
+        properties = (
+            self.package.get_resource("echemdb").schema.get_field(field_name).custom
         )
 
-        return fig
+        if field_name == "E" and "reference" in properties:
+            return f"{field_name} [{properties['unit']} vs. {properties['reference']}]"
+
+        return f"{field_name} [{properties['unit']}]"
@@ -63,6 +63,25 @@ Extra methods are added if the descriptor satisfies a certain interface::
 #  You should have received a copy of the GNU General Public License
 #  along with unitpackage. If not, see <https://www.gnu.org/licenses/>.
 # ********************************************************************
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _unit(unit):
+    r"""
+    Return the astropy unit encoded by the string ``unit``.
+
+    EXAMPLES::
+
+        >>> _unit('mA / cm2')
+        Unit("mA / cm2")
+        >>> _unit('mA / cm2') is _unit('mA / cm2')
+        True
+
+    """
+    from astropy import units
+
+    return units.Unit(unit)
 
 
 class GenericDescriptor:
@@ -193,9 +212,7 @@ class QuantityDescriptor(GenericDescriptor):
             <Quantity 298.15 K>
 
         """
-        from astropy import units
-
-        return float(self.value) * units.Unit(self.unit)
+        return float(self.value) * _unit(self.unit)
 
     def __repr__(self):
         r"""
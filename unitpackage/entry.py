@@ -73,14 +73,141 @@ also contain information on the source of the data.::
 #  You should have received a copy of the GNU General Public License
 #  along with unitpackage. If not, see <https://www.gnu.org/licenses/>.
 # ********************************************************************
+import atexit
+import copy
 import logging
 import os.path
+import shutil
+import tempfile
+from collections.abc import Mapping
+from functools import cache, lru_cache
+from glob import glob
 
 from unitpackage.descriptor import Descriptor
 
 logger = logging.getLogger("unitpackage")
 
 
+@lru_cache(maxsize=512)
+def _parse_bibtex(bibdata):
+    r"""
+    Return the pybtex bibliography database encoded in the BibTeX string ``bibdata``.
+
+    EXAMPLES::
+
+        >>> bibliography = _parse_bibtex("@article{doe_2021, title={A Title}}")
+        >>> bibliography.entries['doe_2021'].fields['title']
+        'A Title'
+        >>> _parse_bibtex("@article{doe_2021, title={A Title}}") is bibliography
+        True
+
+    """
+    from pybtex.database import parse_string
+
+    return parse_string(bibdata, "bibtex")
+
+
+@lru_cache(maxsize=256)
+def _conversion_factor(unit, new_unit):
+    r"""
+    Return the factor which converts values in ``unit`` to ``new_unit``.
+
+    EXAMPLES::
+
+        >>> _conversion_factor('A / m2', 'mA / cm2')
+        0.1
+
+    """
+    from astropy import units as u
+
+    return u.Unit(unit).to(u.Unit(new_unit))
+
+
+@cache
+def _echemdb_style():
+    r"""
+    Return the pybtex style used to render citations in :meth:`Entry.citation`.
+
+    EXAMPLES::
+
+        >>> _echemdb_style() is _echemdb_style()
+        True
+
+    """
+    from pybtex.style.formatting.unsrt import Style
+    from pybtex.style.template import field, node, sentence, tag, words
+
+    @node
+    def names(_, context, role):
+        persons = context["entry"].persons[role]
+        style = context["style"]
+
+        # Only the first author is shown, so the others need not be formatted.
+        name = style.format_name(persons[0], style.abbreviate_names)
+
+        if len(persons) == 1:
+            return name.format_data(context)
+
+        # pylint: disable=no-value-for-parameter
+        return words(sep=" ")[name, tag("i")["et al."]].format_data(context)
+
+    # TODO:: Improve the citation style. (see #104)
+    class EchemdbStyle(Style):
+        r"""
+        A citation style for the echemdb website.
+        """
+
+        def format_names(self, role, as_sentence=True):
+            # pylint: disable=no-value-for-parameter
+            template = names(role)
+            return sentence[template] if as_sentence else template
+
+        def format_title(self, e, which_field, as_sentence=True):
+            # pylint: disable=no-value-for-parameter
+            title = tag("i")[field(which_field)]
+            return sentence[title] if as_sentence else title
+
+    return EchemdbStyle(abbreviate_names=True)
+
+
+@lru_cache(maxsize=512)
+def _format_citation(bibdata, citation_key):
+    r"""
+    Return the entry ``citation_key`` of the BibTeX string ``bibdata``
+    formatted with the :func:`_echemdb_style` as pybtex rich text.
+
+    EXAMPLES::
+
+        >>> bibdata = "@article{doe_2021, author={Doe, John}, title={A Title}, journal={Journal}, year={2021}}"
+        >>> _format_citation(bibdata, 'doe_2021').render_as('text')
+        'J. Doe. A Title. Journal, 2021.'
+        >>> _format_citation(bibdata, 'doe_2021') is _format_citation(bibdata, 'doe_2021')
+        True
+
+    """
+    return (
+        _echemdb_style()
+        .format_entry("unused", _parse_bibtex(bibdata).entries[citation_key])
+        .text
+    )
+
+
+@lru_cache(maxsize=512)
+def _render_citation(bibdata, citation_key, backend):
+    r"""
+    Return the citation of the entry ``citation_key`` of the BibTeX string
+    ``bibdata`` rendered with the pybtex ``backend``.
+
+    EXAMPLES::
+
+        >>> bibdata = "@article{doe_2021, author={Doe, John}, title={A Title}, journal={Journal}, year={2021}}"
+        >>> _render_citation(bibdata, 'doe_2021', 'md')
+        'J\\. Doe\\.\n*A Title*\\.\n*Journal*, 2021\\.'
+
+    """
+    return _format_citation(bibdata, citation_key).render_as(backend)
+
+
 class Entry:
     r"""
     A `frictionless data package <https://github.com/frictionlessdata/framework>`_
@@ -224,18 +351,25 @@ class Entry:
             >>> entry_no_bib.bibliography
             ''
 
+        TESTS:
+
+        Each access returns an independent object::
+
+            >>> entry.bibliography.fields['title'] = 'Another Title'
+            >>> entry.bibliography.fields['title']
+            'Electrochemistry at Ru(0001) in a flowing CO-saturated electrolyte—reactive and inert adlayer phases'
+
         """
-        metadata = self._metadata.setdefault("source", {})
-        citation = metadata.setdefault("bibdata", "")
+        source = self._metadata.setdefault("source", {})
+        citation = source.setdefault("bibdata", "")
 
         if not citation:
-            logger.warning(f"Entry with name {self.identifier} has no bibliography.")
+            logger.warning("Entry with name %s has no bibliography.", self.identifier)
             return citation
 
-        from pybtex.database import parse_string
-
-        bibliography = parse_string(citation, "bibtex")
-        return bibliography.entries[self.source.citation_key]
+        # The parsed BibTeX is shared by all entries of the same publication,
+        # so we return a copy that can be modified safely.
+        return copy.deepcopy(_parse_bibtex(citation).entries[source["citation key"]])
 
     def citation(self, backend="text"):
         r"""
@@ -256,57 +390,34 @@ class Entry:
             *Electrochemistry at Ru\(0001\) in a flowing CO\-saturated electrolyte—reactive and inert adlayer phases*\.
             *Physical Chemistry Chemical Physics*, 13\(13\):6010–6021, 2011\.
 
-        """
-        from pybtex.style.formatting.unsrt import Style
-
-        # TODO:: Remove `class EchemdbStyle` from citation and improve citation style. (see #104)
-        class EchemdbStyle(Style):
-            r"""
-            A citation style for the echemdb website.
-            """
-
-            def format_names(self, role, as_sentence=True):
-                from pybtex.style.template import node
-
-                @node
-                def names(_, context, role):
-                    persons = context["entry"].persons[role]
-                    style = context["style"]
-
-                    names = [
-                        style.format_name(person, style.abbreviate_names)
-                        for person in persons
-                    ]
-
-                    if len(names) == 1:
-                        return names[0].format_data(context)
+        TESTS:
 
-                    from pybtex.style.template import tag, words
+        The citation is rendered only once for each backend::
 
-                    # pylint: disable=no-value-for-parameter
-                    return words(sep=" ")[names[0], tag("i")["et al."]].format_data(
-                        context
-                    )
+            >>> entry.citation(backend='md') is entry.citation(backend='md')
+            True
 
-                # pylint: disable=no-value-for-parameter
-                names = names(role)
+        The citation follows changes to the entry's bibliography::
 
-                from pybtex.style.template import sentence
+            >>> source = entry._metadata['source']
+            >>> source['bibdata'] = source['bibdata'].replace('Alves', 'Doe')
+            >>> entry.citation(backend='text')
+            'O. B. Doe et al. ...'
 
-                return sentence[names] if as_sentence else names
+        An entry without a bibliography cannot be cited::
 
-            def format_title(self, e, which_field, as_sentence=True):
-                from pybtex.style.template import field, sentence, tag
+            >>> entry_no_bib = Entry.create_examples(name="no_bibliography")[0]
+            >>> entry_no_bib.citation()
+            Traceback (most recent call last):
+            ...
+            ValueError: Entry with name no_bibliography has no bibliography.
 
-                # pylint: disable=no-value-for-parameter
-                title = tag("i")[field(which_field)]
-                return sentence[title] if as_sentence else title
+        """
+        if not self.bibliography:
+            raise ValueError(f"Entry with name {self.identifier} has no bibliography.")
 
-        return (
-            EchemdbStyle(abbreviate_names=True)
-            .format_entry("unused", self.bibliography)
-            .text.render_as(backend)
-        )
+        source = self._metadata["source"]
+        return _render_citation(source["bibdata"], source["citation key"], backend)
 
     def field_unit(self, field_name):
         r"""
@@ -357,9 +468,19 @@ class Entry:
             1     0.000006 -0.102158 -98.176205
             ...
 
-        """
-        from collections.abc import Mapping
+        TESTS:
+
+        Fields which are already in the requested unit are not modified::
 
+            >>> rescaled_entry = entry.rescale({'E': 'V', 'j': 'mA / cm2'})
+            >>> rescaled_entry.package.get_resource('echemdb').schema.fields
+            [{'name': 't', 'type': 'number', 'unit': 's'},
+            {'name': 'E', 'type': 'number', 'unit': 'V', 'reference': 'RHE'},
+            {'name': 'j', 'type': 'number', 'unit': 'mA / cm2'}]
+            >>> rescaled_entry.df['E'].equals(entry.df['E'])
+            True
+
+        """
         if not isinstance(units, Mapping):
             raise ValueError(
                 "'units' must have the format {'dimension': 'new unit'}, e.g., `{'j': 'uA / cm2', 't': 'h'}`"
@@ -368,26 +489,28 @@ class Entry:
         if not units:
             units = {}
 
-        from astropy import units as u
         from frictionless import Package, Resource
 
         package = Package(self.package.to_dict())
         fields = self.package.get_resource("echemdb").schema.fields
-        df = self.df.copy()
+        df = self.df
+
+        # the rescaled columns as NumPy arrays
+        columns = {}
 
         for field in fields:
-            if field.name in units:
-                df[field.name] *= u.Unit(field.custom["unit"]).to(
-                    u.Unit(units[field.name])
+            # Fields which are already in the requested unit are not touched.
+            if field.name in units and units[field.name] != field.custom["unit"]:
+                columns[field.name] = df[field.name].to_numpy() * _conversion_factor(
+                    field.custom["unit"], units[field.name]
                 )
                 package.get_resource("echemdb").schema.update_field(
                     field.name, {"unit": units[field.name]}
                 )
 
-        # create a new dataframe resource
-        df_resource = Resource(df)
-        df_resource.infer()
-        # update units in the schema of the df resource
+        # create a new dataframe resource with the updated units in its schema
+        # (the schema is known and need not be inferred from the data)
+        df_resource = Resource(df.assign(**columns))
         df_resource.schema = package.get_resource("echemdb").schema
 
         df_resource.name = "echemdb"
@@ -470,8 +593,6 @@ class Entry:
         packages = collect_datapackages(example_dir)
 
         if len(packages) == 0:
-            from glob import glob
-
             raise ValueError(
                 f"No literature data found for {name}. The directory for this data {example_dir} exists. But we could not find any datapackages in there. "
                 f"There is probably some outdated data in {example_dir}. The contents of that directory are: { glob(os.path.join(example_dir,'**')) }"
@@ -499,15 +620,17 @@ class Entry:
         """
         import plotly.graph_objects
 
-        x_label = x_label or self.df.columns[0]
-        y_label = y_label or self.df.columns[1]
+        df = self.df
+
+        x_label = x_label or df.columns[0]
+        y_label = y_label or df.columns[1]
 
         fig = plotly.graph_objects.Figure()
 
         fig.add_trace(
             plotly.graph_objects.Scatter(
-                x=self.df[x_label],
-                y=self.df[y_label],
+                x=df[x_label],
+                y=df[y_label],
                 mode="lines",
                 name=name or self.identifier,
             )
@@ -520,8 +643,8 @@ class Entry:
             width=600,
             height=400,
             margin={"l": 70, "r": 70, "b": 70, "t": 70, "pad": 7},
-            xaxis_title=f"{x_label} [{self.field_unit(x_label)}]",
-            yaxis_title=f"{y_label} [{self.field_unit(y_label)}]",
+            xaxis_title=self._axis_label(x_label),
+            yaxis_title=self._axis_label(y_label),
         )
 
         fig.update_xaxes(showline=True, mirror=True)
@@ -529,6 +652,20 @@ class Entry:
 
         return fig
 
+    def _axis_label(self, field_name):
+        r"""
+        Return the axis label of the field ``field_name`` used in :meth:`plot`,
+        i.e., the field name followed by its unit.
+
+        EXAMPLES::
+
+            >>> entry = Entry.create_examples()[0]
+            >>> entry._axis_label('j')
+            'j [A / m2]'
+
+        """
+        return f"{field_name} [{self.field_unit(field_name)}]"
+
     @classmethod
     def from_csv(cls, csvname, metadata=None, fields=None):
         r"""
@@ -648,7 +785,6 @@ class Entry:
         )
 
         df_resource = Resource(df)
-        df_resource.infer()
         df_resource.schema = Schema.from_descriptor(
             {"fields": new_fields}, allow_invalid=True
         )
@@ -719,10 +855,6 @@ class Entry:
 
         """
         if outdir is None:
-            import atexit
-            import shutil
-            import tempfile
-
             outdir = tempfile.mkdtemp()
             atexit.register(shutil.rmtree, outdir)
 
@@ -25,9 +25,11 @@ collecting packages and creating unitpackages.
 #  along with unitpackage. If not, see <https://www.gnu.org/licenses/>.
 # ********************************************************************
 
+import json
 import logging
 import os
 import os.path
+from datetime import date, datetime
 from glob import glob
 
 import pandas as pd
@@ -230,8 +232,6 @@ def write_metadata(out, metadata):
         Return `item` that Python's json package does not know how to serialize
         in a format that Python's json package does know how to serialize.
         """
-        from datetime import date, datetime
-
         # The YAML standard knows about dates and times, so we might see these
         # in the metadata. However, standard JSON does not know about these so
         # we need to serialize them as strings explicitly.
@@ -240,8 +240,6 @@ def write_metadata(out, metadata):
 
         raise TypeError(f"Cannot serialize ${item} of type ${type(item)} to JSON.")
 
-    import json
-
     json.dump(metadata, out, default=defaultconverter, ensure_ascii=False, indent=4)
     # json.dump does not save files with a newline, which compromises the tests
     # where the output files are compared to an expected json.